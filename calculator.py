@@ -35,6 +35,7 @@ Supported Operators:
     • Negative numbers
     • Parentheses or complex expressions
 - Input must strictly follow the format: num1 operator num2
+- Expressions longer than 256 characters are rejected
 
 🔁 Program Flow:
 ---------------
@@ -51,6 +52,43 @@ Author: Abhisakh Sarma
 ==============================================================================
 """
 
+import operator as _op
+import re
+
+
+#==================== PRECOMPILED EXPRESSION PATTERN ====================
+# num1 operator num2, with optional surrounding spaces (compiled once at import)
+_EXPR_RE = re.compile(r"^\s*(\d+)\s*([-+*/~])\s*(\d+)\s*$")
+
+
+#==================== OPERATOR DISPATCH TABLE ====================
+# '~' maps to divmod, which returns the (quotient, remainder) pair
+_OPS = {
+    "+": _op.add,
+    "-": _op.sub,
+    "*": _op.mul,
+    "/": _op.truediv,
+    "~": divmod,
+}
+
+
+#==================== INPUT LIMITS ====================
+# Longer input is rejected before parsing; this also keeps operands and results
+# well below CPython's int/str conversion limit of 4300 digits
+_MAX_EXPR_LEN = 256
+
+
+#==================== PRECOMPUTED MESSAGES ====================
+# Prompts and error messages are built once here instead of on every loop pass
+_WELCOME = "\033[94mWelcome to the Python calculator!\033[0m"
+_PROMPT_COUNT = "\033[93mHow many calculations do you want to do? \033[0m"
+_PROMPT_EXPR = "\033[93mWhat do you want to calculate? (e.g. 12 + 5) \033[0m"
+_ERR_COUNT = "\033[91m--Error: Number of calculations must be an integer--\033[0m"
+_ERR_INVALID = "\033[91m--Error: Invalid expression. Use format: num1 operator num2 (e.g. 5 + 3)--\033[0m"
+_ERR_TOO_LONG = "\033[91m--Error: Expression is too long (max 256 characters)--\033[0m"
+_ERR_ZERO_DIV = "\033[91m--Error: Division by zero is not possible--\033[0m"
+_ERR_OPERATOR = "\033[91m--Error: Unsupported operator--\033[0m"
+
 
 #==================== FUNCTION TO PARSE INPUT ====================
 def split_expression(text_input):
@@ -58,18 +96,10 @@ def split_expression(text_input):
     Splits the input string into two numbers and one operator.
     Returns (num1, operator, num2) if valid, otherwise (None, None, None).
     """
-    operators = "+-*/~"
-    for i, char in enumerate(text_input):
-        if char in operators:
-            num1 = text_input[:i].strip()
-            operator = char
-            num2 = text_input[i+1:].strip()
-
-            # Validate numbers
-            if not (num1.isdigit() and num2.isdigit()):
-                return None, None, None
-            return num1, operator, num2
-    return None, None, None
+    match = _EXPR_RE.match(text_input)
+    if match is None:
+        return None, None, None
+    return match.groups()
 
 
 #==================== FUNCTION TO PERFORM SINGLE CALCULATION ====================
@@ -81,35 +111,41 @@ def calculate(num1, operator, num2):
     first_number = int(num1)
     second_number = int(num2)
 
-    if operator == "+":
-        return first_number + second_number
-    elif operator == "-":
-        return first_number - second_number
-    elif operator == "*":
-        return first_number * second_number
-    elif operator == "/":
-        if second_number == 0:
-            return "\033[91m--Error: Division by zero is not possible--\033[0m"
-        return first_number / second_number
-    elif operator == "~":
-        if second_number == 0:
-            return "\033[91m--Error: Division by zero is not possible--\033[0m"
-        return (first_number // second_number, first_number % second_number)
-    else:
-        return "\033[91m--Error: Unsupported operator--\033[0m"
+    operation = _OPS.get(operator)
+    if operation is None:
+        return _ERR_OPERATOR
+    try:
+        return operation(first_number, second_number)
+    except ZeroDivisionError:
+        return _ERR_ZERO_DIV
 
 
 #==================== FUNCTION TO PRINT RESULTS ====================
+def _print_scalar(result):
+    """
+    Prints a single result (a number or an error message).
+    """
+    print(f"\033[92mThe answer is {result}\033[0m")
+
+
+def _print_tuple(result):
+    """
+    Prints the (quotient, remainder) pair returned for '~'.
+    """
+    print(f"\033[92mThe answer is {result[0]}\033[0m")
+    print(f"\033[94mThe remainder is {result[1]}\033[0m")
+
+
+# Printer per exact result type; any other type is printed as a single value
+_PRINTERS = {tuple: _print_tuple}
+
+
 def print_function(result):
     """
     Prints the calculation result(s) based on the return type.
     If result is a tuple, prints quotient and remainder.
     """
-    if isinstance(result, tuple):
-        print(f"\033[92mThe answer is {result[0]}\033[0m")
-        print(f"\033[94mThe remainder is {result[1]}\033[0m")
-    else:
-        print(f"\033[92mThe answer is {result}\033[0m")
+    _PRINTERS.get(type(result), _print_scalar)(result)
 
 
 #==================== FUNCTION TO HANDLE MULTIPLE CALCULATIONS ====================
@@ -121,15 +157,19 @@ def calculate_multiple(num):
     try:
         num = int(num)
     except ValueError:
-        print("\033[91m--Error: Number of calculations must be an integer--\033[0m")
+        print(_ERR_COUNT)
         return
 
     for _ in range(num):
-        user_input1 = input("\033[93mWhat do you want to calculate? (e.g. 12 + 5) \033[0m")
+        user_input1 = input(_PROMPT_EXPR)
+        if len(user_input1) > _MAX_EXPR_LEN:
+            print(_ERR_TOO_LONG)
+            continue
+
         num1, operator, num2 = split_expression(user_input1)
 
         if num1 is None:
-            print("\033[91m--Error: Invalid expression. Use format: num1 operator num2 (e.g. 5 + 3)--\033[0m")
+            print(_ERR_INVALID)
             continue
 
         result = calculate(num1, operator, num2)
@@ -138,6 +178,6 @@ def calculate_multiple(num):
 
 #==================== PROGRAM START ====================
 if __name__ == "__main__":
-    print("\033[94mWelcome to the Python calculator!\033[0m")
-    user_input2 = input("\033[93mHow many calculations do you want to do? \033[0m")
+    print(_WELCOME)
+    user_input2 = input(_PROMPT_COUNT)
     calculate_multiple(user_input2)
@@ -30,6 +30,7 @@ Limitations:
 - Only supports integer inputs
 - Does not support decimal numbers, negative numbers, or parentheses
 - Only handles expressions in the format: num1 operator num2
+- Expressions longer than 256 characters are rejected
 
 Structure(FLOW):
 ---------------
@@ -45,24 +46,63 @@ Author: Abhisakh Sarma
 ==============================================================================
 """
 
+import operator as _op
+import re
+
+
+#==================== PRECOMPILED OPERATOR PATTERN ====================
+# Locates the first operator in C instead of a Python-level character loop
+_OP_RE = re.compile(r"[-+*/~]")
+
+
+#==================== OPERATOR DISPATCH TABLE ====================
+# '~' maps to divmod, which returns the (quotient, remainder) pair
+_OPS = {
+    "+": _op.add,
+    "-": _op.sub,
+    "*": _op.mul,
+    "/": _op.truediv,
+    "~": divmod,
+}
+
+
+#==================== INPUT LIMITS ====================
+# Longer input is rejected before parsing; this also keeps operands and results
+# well below CPython's int/str conversion limit of 4300 digits
+_MAX_EXPR_LEN = 256
+
+
+#==================== PRECOMPUTED MESSAGES ====================
+# Prompts and error messages are built once here instead of on every loop pass
+_WELCOME = "Welcome to the Python calculator!"
+_PROMPT_COUNT = "How many calculations do you want to do? "
+_PROMPT_EXPR = "What do you want to calculate? (e.g. 12 + 5) "
+_ERR_COUNT = "--Error: Number of calculations must be an integer--"
+_ERR_INVALID = "--Error: Invalid expression. Use format: num1 operator num2 (e.g. 5 + 3)--"
+_ERR_TOO_LONG = "--Error: Expression is too long (max 256 characters)--"
+_ERR_ZERO_DIV = "--Error: Division by zero is not possible--"
+_ERR_OPERATOR = "--Error: Unsupported operator--"
+
+
 #==================== FUNCTION TO PARSE INPUT ====================
 def split_expression(text_input):
     """
     Splits the input string into two numbers and one operator.
     Returns (num1, operator, num2) if valid, otherwise (None, None, None).
     """
-    operators = "+-*/~"
-    for i, char in enumerate(text_input):
-        if char in operators:
-            num1 = text_input[:i].strip()
-            operator = char
-            num2 = text_input[i+1:].strip()
+    match = _OP_RE.search(text_input)
+    if match is None:
+        return None, None, None
+
+    i = match.start()
+    num1 = text_input[:i].strip()
+    operator = text_input[i]
+    num2 = text_input[i+1:].strip()
 
-            # Validate numbers
-            if not (num1.isdigit() and num2.isdigit()):
-                return None, None, None
-            return num1, operator, num2
-    return None, None, None
+    # Validate numbers
+    if not (num1.isdigit() and num2.isdigit()):
+        return None, None, None
+    return num1, operator, num2
 
 
 #==================== FUNCTION TO PERFORM SINGLE CALCULATION ====================
@@ -74,35 +114,41 @@ def calculate(num1, operator, num2):
     first_number = int(num1)
     second_number = int(num2)
 
-    if operator == "+":
-        return first_number + second_number
-    elif operator == "-":
-        return first_number - second_number
-    elif operator == "*":
-        return first_number * second_number
-    elif operator == "/":
-        if second_number == 0:
-            return "--Error: Division by zero is not possible--"
-        return first_number / second_number
-    elif operator == "~":
-        if second_number == 0:
-            return "--Error: Division by zero is not possible--"
-        return (first_number // second_number, first_number % second_number)
-    else:
-        return "--Error: Unsupported operator--"
+    operation = _OPS.get(operator)
+    if operation is None:
+        return _ERR_OPERATOR
+    try:
+        return operation(first_number, second_number)
+    except ZeroDivisionError:
+        return _ERR_ZERO_DIV
 
 
 #==================== FUNCTION TO PRINT RESULTS ====================
+def _print_scalar(result):
+    """
+    Prints a single result (a number or an error message).
+    """
+    print(f"The answer is {result}")
+
+
+def _print_tuple(result):
+    """
+    Prints the (quotient, remainder) pair returned for '~'.
+    """
+    print(f"The answer is {result[0]}")
+    print(f"The remainder is {result[1]}")
+
+
+# Printer per exact result type; any other type is printed as a single value
+_PRINTERS = {tuple: _print_tuple}
+
+
 def print_function(result):
     """
     Prints the calculation result(s) based on the return type.
     If result is a tuple, prints quotient and remainder.
     """
-    if isinstance(result, tuple):
-        print(f"The answer is {result[0]}")
-        print(f"The remainder is {result[1]}")
-    else:
-        print(f"The answer is {result}")
+    _PRINTERS.get(type(result), _print_scalar)(result)
 
 
 #==================== FUNCTION TO HANDLE MULTIPLE CALCULATIONS ====================
@@ -114,15 +160,19 @@ def calculate_multiple(num):
     try:
         num = int(num)
     except ValueError:
-        print("--Error: Number of calculations must be an integer--")
+        print(_ERR_COUNT)
         return
 
     for _ in range(num):
-        user_input1 = input("What do you want to calculate? (e.g. 12 + 5) ")
+        user_input1 = input(_PROMPT_EXPR)
+        if len(user_input1) > _MAX_EXPR_LEN:
+            print(_ERR_TOO_LONG)
+            continue
+
         num1, operator, num2 = split_expression(user_input1)
 
         if num1 is None:
-            print("--Error: Invalid expression. Use format: num1 operator num2 (e.g. 5 + 3)--")
+            print(_ERR_INVALID)
             continue
 
         result = calculate(num1, operator, num2)
@@ -131,6 +181,6 @@ def calculate_multiple(num):
 
 #==================== PROGRAM START ====================
 if __name__ == "__main__":
-    print("Welcome to the Python calculator!")
-    user_input2 = input("How many calculations do you want to do? ")
+    print(_WELCOME)
+    user_input2 = input(_PROMPT_COUNT)
     calculate_multiple(user_input2)